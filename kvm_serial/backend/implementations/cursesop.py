@@ -41,7 +41,7 @@ MODIFIER_CODES = {
 }
 
 # Mapping of control character codes (from curses) to character codes
-CONTROL_CHARACTERS = {
+_CONTROL_CHARACTER_MAP = {
     0x11: 0x14,  # ^Q
     0x17: 0x1A,  # ^W
     0x05: 0x08,  # ^E
@@ -72,6 +72,9 @@ CONTROL_CHARACTERS = {
     0x7F: 0x2A,  # ^? Ctrl+8 (also backspace!)
 }
 
+# The same mapping indexed by control character code, None where unmapped
+CONTROL_CHARACTERS = tuple(_CONTROL_CHARACTER_MAP.get(code) for code in range(0x80))
+
 
 class CursesOp(BaseOp):
     def __init__(self, serial_port, layout: str = "en_GB"):
@@ -140,9 +143,11 @@ class CursesOp(BaseOp):
                     term.addstr(key)
                     return True
 
+                code = ord(key)
+
                 # Is it a control character?
-                elif ord(key) in CONTROL_CHARACTERS.keys():
-                    self.sc = build_scancode(CONTROL_CHARACTERS[ord(key)], 0x1)
+                if code < len(CONTROL_CHARACTERS) and CONTROL_CHARACTERS[code] is not None:
+                    self.sc = build_scancode(CONTROL_CHARACTERS[code], 0x1)
 
                 # Otherwise, received key was a single character
                 else:
@@ -150,13 +155,13 @@ class CursesOp(BaseOp):
 
                 # If debug logging, be a little more verbose:
                 if logging.DEBUG >= logging.root.level:
-                    term.addstr(str(key) + f"\t{str(hex(ord(key)))}\n")
+                    term.addstr(str(key) + f"\t{str(hex(code))}\n")
                 else:
                     term.addstr(str(key))
 
                 # Handle ESC:
                 #   break out of the loop by returning "False"
-                if ord(key) == 0x1B:
+                if code == 0x1B:
                     return False
 
             # Handle common exceptions and continue to next loop (return True):
@@ -46,6 +46,7 @@ from PyQt5.QtWidgets import (
 )
 
 import kvm_serial.utils.settings as settings_util
+from kvm_serial.utils.settings import get_bool, get_int
 from kvm_serial.utils.communication import list_serial_ports
 from kvm_serial.utils import scancode_to_ascii, string_to_scancodes
 from kvm_serial.backend.video import CameraProperties, enumerate_cameras
@@ -133,6 +134,9 @@ class KVMQtGui(QMainWindow):
     """
 
     CONFIG_FILE: str = ".kvm_settings.ini"
+    # Minimum spacing of mouse move reports sent to the target; moves arriving
+    # in between are coalesced so only the latest position is sent
+    MOUSE_MOVE_INTERVAL_MS: int = 10
 
     baud_rates: list[int] = [1200, 2400, 4800, 9600, 19200, 38400, 57600, 115200]
     serial_ports: list[str] = []
@@ -164,9 +168,17 @@ class KVMQtGui(QMainWindow):
     hide_mouse_var: bool = False
 
     _quitting: bool = False
+    # Inputs the status bar was last rendered from; see _update_status_bar
+    _status_snapshot: tuple = ()
+    # Inputs the device menus were last built from; see _populate_*_menu
+    _serial_menu_signature: tuple = ()
+    _video_menu_signature: tuple = ()
 
     pos_x: int = 0
     pos_y: int = 0
+    # (x, y, width, height) of the latest move not yet sent; see _on_mouse_move
+    _pending_mouse_move: tuple | None = None
+    _mouse_move_throttled: bool = False
 
     # IO
     serial_port: Serial | None = None
@@ -489,6 +501,32 @@ class KVMQtGui(QMainWindow):
         if not self.show_status_var:
             return
 
+        # The timer fires twice a second whether or not anything changed. Skip
+        # the label updates (and the repaints they trigger) when every input
+        # the status bar is rendered from is the same as last time.
+        camera_width, camera_height = self._camera_resolution()
+        idx = self.video_var
+        if idx >= 0 and idx < len(self.video_devices):
+            video = str(self.video_devices[idx])
+        else:
+            # Show video_device_var status (e.g., "Initialising...", "None found", "Error")
+            # instead of hardcoded "Idle" when no camera is selected
+            video = self.video_device_var
+        snapshot = (
+            self.serial_port_var,
+            self.baud_rate_var,
+            self.keyboard_var,
+            self.keyboard_last,
+            self.pos_x,
+            self.pos_y,
+            camera_width,
+            camera_height,
+            video,
+        )
+        if snapshot == self._status_snapshot:
+            return
+        self._status_snapshot = snapshot
+
         # Update each status bar part
         self.status_serial_label.setText(
             f"Serial: {self.serial_port_var} @{self.baud_rate_var} baud"
@@ -497,17 +535,10 @@ class KVMQtGui(QMainWindow):
         captured = "Captured" if self.keyboard_var else "Idle"
         self.status_keyboard_label.setText(f"Keyboard: {captured} {self.keyboard_last}")
 
-        camera_width, camera_height = self._camera_resolution()
         report = f"Mouse: [x:{self.pos_x} y:{self.pos_y}] in [{camera_width}x{camera_height}]"
         self.status_mouse_label.setText(report)
-        idx = self.video_var
 
-        if idx >= 0 and idx < len(self.video_devices):
-            self.status_video_label.setText(f"Video: {str(self.video_devices[idx])}")
-        else:
-            # Show video_device_var status (e.g., "Initialising...", "None found", "Error")
-            # instead of hardcoded "Idle" when no camera is selected
-            self.status_video_label.setText(f"Video: {self.video_device_var}")
+        self.status_video_label.setText(f"Video: {video}")
 
     def _toggle_verbose(self):
         """Toggle verbose logging and update log level."""
@@ -545,8 +576,9 @@ class KVMQtGui(QMainWindow):
                 action.setChecked(action.text() == self.serial_port_var)
 
         # Load baud rate setting (only if valid)
-        if kvm.get("baud_rate") and int(kvm.get("baud_rate", "")) in self.baud_rates:
-            self.baud_rate_var = int(kvm.get("baud_rate", ""))
+        baud_rate = get_int(kvm, "baud_rate")
+        if baud_rate in self.baud_rates:
+            self.baud_rate_var = baud_rate
             # Update menu selection
             for action in self.baud_rate_menu.actions():
                 action.setChecked(action.text() == str(self.baud_rate_var))
@@ -594,10 +626,10 @@ class KVMQtGui(QMainWindow):
                 self._set_camera(self.video_devices[self.video_var])
 
         # Load other boolean settings
-        self.window_var = kvm.get("windowed", "False") == "True"
-        self.verbose_var = kvm.get("verbose", "False") == "True"
-        self.show_status_var = kvm.get("statusbar", "True") == "True"
-        self.hide_mouse_var = kvm.get("hide_mouse", "False") == "True"
+        self.window_var = get_bool(kvm, "windowed", False)
+        self.verbose_var = get_bool(kvm, "verbose", False)
+        self.show_status_var = get_bool(kvm, "statusbar", True)
+        self.hide_mouse_var = get_bool(kvm, "hide_mouse", False)
 
         # Load keyboard layout, auto-detect if not previously configured
         if "keyboard_layout" in kvm:
@@ -610,10 +642,7 @@ class KVMQtGui(QMainWindow):
         # Load protocol selection (default CH9329 if missing or invalid)
         saved_protocol = kvm.get("protocol", "ch9329")
         if saved_protocol == "ch9350":
-            try:
-                saved_state = int(kvm.get("ch9350_state", "2"))
-            except ValueError:
-                saved_state = 2
+            saved_state = get_int(kvm, "ch9350_state", 2)
             if saved_state in (0, 2, 3, 4):
                 self.protocol_var = "ch9350"
                 self.ch9350_state_var = saved_state
@@ -625,26 +654,23 @@ class KVMQtGui(QMainWindow):
                 self.protocol_var = "ch9329"
         else:
             self.protocol_var = "ch9329"
-        if hasattr(self, "protocol_menu") and self.protocol_menu is not None:
+        if self.protocol_menu is not None:
             target = self._protocol_label(self.protocol_var, self.ch9350_state_var)
             for action in self.protocol_menu.actions():
                 action.setChecked(action.text() == target)
 
-        # Apply mouse cursor state if needed
-        if hasattr(self, "video_view"):
-            if self.hide_mouse_var:
-                self.video_view.setCursor(Qt.CursorShape.BlankCursor)
-            else:
-                self.video_view.setCursor(Qt.CursorShape.ArrowCursor)
-        # Set the checked state of the menu item if it exists
-        if hasattr(self, "mouse_action"):
-            self.mouse_action.setChecked(self.hide_mouse_var)
+        # Apply mouse cursor state
+        if self.hide_mouse_var:
+            self.video_view.setCursor(Qt.CursorShape.BlankCursor)
+        else:
+            self.video_view.setCursor(Qt.CursorShape.ArrowCursor)
+        # Set the checked state of the menu item
+        self.mouse_action.setChecked(self.hide_mouse_var)
         # And for verbose logging
-        if hasattr(self, "verbose_action"):
-            self.verbose_action.setChecked(self.verbose_var)
-            self._apply_log_level()
+        self.verbose_action.setChecked(self.verbose_var)
+        self._apply_log_level()
         # And for keyboard layout
-        if hasattr(self, "keyboard_layout_menu"):
+        if self.keyboard_layout_menu is not None:
             for action in self.keyboard_layout_menu.actions():
                 action.setChecked(action.text() == self.keyboard_layout_var)
 
@@ -769,16 +795,47 @@ class KVMQtGui(QMainWindow):
                 "Initialise serial_port_menu before calling _populate_serial_port_menu()"
             )
 
-        self.serial_port_menu.clear()
-        for port in self.serial_ports:
-            action = QAction(port, self)
-            action.setCheckable(True)
-            action.triggered.connect(lambda checked, p=port: self._on_serial_port_selected(p))
-            self.serial_port_menu.addAction(action)
+        # Rebuilding is O(n) QAction churn: skip it if nothing has changed
+        signature = (self.serial_port_menu, tuple(self.serial_ports), self.serial_port_var)
+        if signature == self._serial_menu_signature:
+            return
+        self._serial_menu_signature = signature
 
-            # Check the current selection
-            if port == self.serial_port_var:
-                action.setChecked(True)
+        checked = next(
+            (i for i, port in enumerate(self.serial_ports) if port == self.serial_port_var), -1
+        )
+        self._sync_menu_actions(
+            self.serial_port_menu,
+            self.serial_ports,
+            checked,
+            lambda _, port: self._on_serial_port_selected(port),
+        )
+
+    def _sync_menu_actions(self, menu, labels, checked, on_selected):
+        """
+        Update a menu's checkable actions in place to match labels. Existing actions
+        are relabelled; actions are only created or removed for a change in length.
+        :param menu: QMenu to update
+        :param labels: Text of each entry, in order
+        :param checked: Index of the entry to check (-1 for none)
+        :param on_selected: Called with (index, label) when an entry is triggered
+        """
+        actions = menu.actions()
+        for action in actions[len(labels) :]:
+            menu.removeAction(action)
+            action.deleteLater()
+
+        for i, label in enumerate(labels):
+            if i < len(actions):
+                action = actions[i]
+                action.setText(label)
+            else:
+                action = QAction(label, self)
+                action.setCheckable(True)
+                # Read the label back at trigger time, as it may since have been relabelled
+                action.triggered.connect(lambda _, idx=i, a=action: on_selected(idx, a.text()))
+                menu.addAction(action)
+            action.setChecked(i == checked)
 
     def _populate_baud_rates(self):
         """
@@ -1135,19 +1192,16 @@ class KVMQtGui(QMainWindow):
                 "Initialise video_device_menu before calling _populate_video_device_menu()"
             )
 
-        self.video_device_menu.clear()
-        for i, device in enumerate(self.video_devices):
-            label = str(device)
-            action = QAction(label, self)
-            action.setCheckable(True)
-            action.triggered.connect(
-                lambda _, idx=i, lbl=label: self._on_video_device_selected(idx, lbl)
-            )
-            self.video_device_menu.addAction(action)
+        # Rebuilding is O(n) QAction churn: skip it if nothing has changed
+        labels = tuple(str(d) for d in self.video_devices)
+        signature = (self.video_device_menu, labels, self.video_var)
+        if signature == self._video_menu_signature:
+            return
+        self._video_menu_signature = signature
 
-            # Check the current selection
-            if i == self.video_var:
-                action.setChecked(True)
+        self._sync_menu_actions(
+            self.video_device_menu, labels, self.video_var, self._on_video_device_selected
+        )
 
     def _on_video_device_selected(self, device_idx, device_label):
         """
@@ -1390,10 +1444,9 @@ class KVMQtGui(QMainWindow):
         falls back to the CameraProperties default, and finally to the window
         defaults if no camera is active yet.
         """
-        if hasattr(self, "video_item"):
-            native = self.video_item.nativeSize()
-            if native.isValid() and native.width() > 0 and native.height() > 0:
-                return int(native.width()), int(native.height())
+        native = self.video_item.nativeSize()
+        if native.isValid() and native.width() > 0 and native.height() > 0:
+            return int(native.width()), int(native.height())
         cam = self._selected_camera()
         if cam is not None:
             return cam.width, cam.height
@@ -1558,8 +1611,6 @@ class KVMQtGui(QMainWindow):
         Used by the screenshot path. Falls back to grabbing the view widget if
         the video item has no native size yet (camera hasn't streamed a frame).
         """
-        if not hasattr(self, "video_item"):
-            return None
         native = self.video_item.nativeSize()
         if native.isValid() and native.width() > 0:
             pixmap = QPixmap(int(native.width()), int(native.height()))
@@ -1587,6 +1638,8 @@ class KVMQtGui(QMainWindow):
         logging.info(f"Mouse {self.BUTTON_MAP[button]} {pressed} at {int(x)},{int(y)}")
 
         if self.mouse_op:
+            # Land any coalesced move first, so the click happens where the cursor is
+            self._send_pending_mouse_move()
             self.mouse_op.on_click(x, y, MouseButton[self.BUTTON_MAP[button]], down)
 
     def _on_mouse_move(self, x, y):
@@ -1605,16 +1658,46 @@ class KVMQtGui(QMainWindow):
             logging.debug(f"Y coordinate out of bounds: 0 <= {y} >= {camera_height}")
             return False
 
-        report = f"Mouse: [x:{self.pos_x} y:{self.pos_y}] in [{camera_width}x{camera_height}]"
+        # Move events arrive far faster than the serial link can carry reports.
+        # The first move is sent straight away; later ones only replace the
+        # pending position until the throttle interval has elapsed.
+        self._pending_mouse_move = (self.pos_x, self.pos_y, camera_width, camera_height)
+        if not self._mouse_move_throttled:
+            self._flush_mouse_move()
+
+    def _flush_mouse_move(self):
+        """
+        Send the latest coalesced mouse move and hold off the next one for
+        MOUSE_MOVE_INTERVAL_MS. With nothing pending, the throttle is released
+        so that the next move is sent immediately.
+        """
+        if self._pending_mouse_move is None:
+            self._mouse_move_throttled = False
+            return
+
+        self._mouse_move_throttled = True
+        QTimer.singleShot(self.MOUSE_MOVE_INTERVAL_MS, self._flush_mouse_move)
+        self._send_pending_mouse_move()
+
+    def _send_pending_mouse_move(self):
+        """
+        Send the pending mouse move (if any) to the target and report it in the status bar.
+        """
+        if self._pending_mouse_move is None:
+            return
+        x, y, width, height = self._pending_mouse_move
+        self._pending_mouse_move = None
+
+        report = f"Mouse: [x:{x} y:{y}] in [{width}x{height}]"
         logging.debug(report)
         self.status_mouse_label.setText(report)
 
         if self.mouse_op:
             try:
-                self.mouse_op.on_move(self.pos_x, self.pos_y, camera_width, camera_height)
+                self.mouse_op.on_move(x, y, width, height)
             except (OverflowError, ValueError) as e:
                 logging.error(e)
-                logging.error(f"{self.pos_x}, {self.pos_y}, {camera_width}, {camera_height}")
+                logging.error(f"{x}, {y}, {width}, {height}")
 
     def _toggle_mouse(self):
         logging.info("Toggling mouse pointer visibility")
@@ -1755,8 +1838,10 @@ class KVMQtGui(QMainWindow):
                 logging.info("Clipboard is empty")
                 return
 
-            # Convert string to scancodes with key-up signals between characters
-            scancodes = string_to_scancodes(paste_text, key_repeat=1, key_up=1)
+            # Convert to scancodes in the selected layout, with key-up signals between characters
+            scancodes = string_to_scancodes(
+                paste_text, key_repeat=1, key_up=1, layout=self.keyboard_layout_var
+            )
 
             # Disable paste action while transmitting
             self.paste_action.setEnabled(False)
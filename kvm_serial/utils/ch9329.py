@@ -8,8 +8,13 @@ reports on the target side. Frame layout:
     header(2B: 0x57 0xAB) + addr(1B) + cmd(1B) + len(1B) + data + checksum(1B)
 """
 
+import struct
+
 from kvm_serial.utils.communication import DataComm
 
+# Packet header fields: header(2B) + addr(1B) + cmd(1B) + len(1B)
+_HEADER = struct.Struct("<2sccB")
+
 
 class CH9329Comm(DataComm):
     """
@@ -41,19 +46,18 @@ class CH9329Comm(DataComm):
         if len(head) != 2 or len(addr) != 1 or len(cmd) != 1:
             raise ValueError("CH9329 packet header MUST have: header 2b; addr 1b; cmd 1b")
 
-        length = len(data).to_bytes(1, "little")
+        length = len(data)
+        if length > 0xFF:
+            raise OverflowError("CH9329 packet data MUST be at most 255 bytes")
 
-        # Calculate checksum
-        checksum = (
-            sum(head)
-            + int.from_bytes(addr, "big")
-            + int.from_bytes(cmd, "big")
-            + int.from_bytes(length, "big")
-            + sum(data)
-        ) % 256
+        # Fill a single preallocated buffer rather than concatenating each field
+        packet = bytearray(_HEADER.size + length + 1)
+        _HEADER.pack_into(packet, 0, head, addr, cmd, length)
+        packet[_HEADER.size : -1] = data
 
-        # Build data packet
-        packet = head + addr + cmd + length + data + bytes([checksum])
+        # Checksum is the low byte of the sum of every preceding packet byte
+        # (the checksum byte itself is still zero here)
+        packet[-1] = sum(packet) & 0xFF
 
         # Write command to serial port
         self.port.write(packet)
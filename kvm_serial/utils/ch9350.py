@@ -313,6 +313,9 @@ class CH9350Comm(DataComm):
         """
         if self._rx_thread is not None:
             raise RuntimeError("CH9350Comm.start() called twice")
+        # Bound the rx thread's reads so stop() is noticed on a silent line.
+        # Set once here: changing it later reconfigures the port under the tx thread.
+        self.port.timeout = self.RECV_TIMEOUT
         self._stop.clear()
         self._rx_thread = threading.Thread(target=self._rx_loop, daemon=True)
         self._rx_thread.start()
@@ -650,7 +653,8 @@ class CH9350Comm(DataComm):
         buf = bytearray()
         while not self._stop.is_set():
             try:
-                chunk = self.port.read(64)
+                # Bounded by the port timeout set in start()
+                chunk = self.recv_response(64)
             except Exception:
                 # Serial errors during shutdown are expected; fall through
                 # to the stop check on the next iteration.
@@ -1,15 +1,9 @@
 import sys
 import logging
 from abc import ABC, abstractmethod
-from serial import Serial, SerialException
+from serial import Serial
 from serial.tools import list_ports
 
-# termios is Unix-only, not available on Windows
-try:
-    import termios
-except ImportError:
-    termios = None
-
 
 class DataComm(ABC):
     """
@@ -23,6 +17,9 @@ class DataComm(ABC):
     """
 
     SCANCODE_LENGTH = 8
+    # Port read timeout, in seconds, for recv_response(). Set on the port by
+    # start() implementations before any reader thread is spawned.
+    RECV_TIMEOUT = 0.1
 
     def __init__(self, port: Serial):
         self.port = port
@@ -54,6 +51,30 @@ class DataComm(ABC):
         unused fields (e.g. button-only events or pure scroll events).
         """
 
+    def recv_response(self, expected_len: int = 64) -> bytes:
+        """
+        Read up to expected_len bytes sent back by the chip.
+
+        Blocks for at most the port's read timeout waiting for the first byte,
+        then takes whatever else is already buffered, so short frames are
+        returned straight away instead of waiting for a full buffer.
+
+        This only reads: the port timeout is not changed here, since doing so
+        reconfigures the device and may race with writes from another thread.
+        Set it to RECV_TIMEOUT before starting any reader thread.
+
+        :param expected_len: Maximum number of bytes to return
+        :return: The bytes read; empty if nothing arrived within the timeout
+        """
+        data = self.port.read(1)
+        if not data:
+            return b""
+
+        waiting = min(self.port.in_waiting, expected_len - 1)
+        if waiting > 0:
+            data += self.port.read(waiting)
+        return data
+
     def start(self) -> None:
         """
         Optional lifecycle hook invoked once the comm is wired into a BaseOp.
@@ -72,29 +93,12 @@ def list_serial_ports():
     """
     List available serial port names on Windows, Mac, and Linux.
     Uses pyserial's list_ports API for cross-platform enumeration.
+
+    Ports are not opened during enumeration: on systems with Bluetooth
+    serial ports, opening each one can block for several seconds. A port is
+    only opened once it has actually been chosen.
     """
-    result = []
-
-    # Use pyserial's list_ports to enumerate actual available ports
-    ports_info = list_ports.comports()
-
-    for port_info in ports_info:
-        port = port_info.device
-        try:
-            # Verify we can open the port - only import if working
-            s = Serial(port)
-            s.close()
-            result.append(port)
-        except (OSError, ImportError, FileNotFoundError, SerialException) as e:
-            # Don't append ports we can't open
-            logging.error(f"{port} could not be opened: {e}")
-        except Exception as e:
-            # Handle termios.error on Unix systems (termios is None on Windows)
-            if termios and type(e).__name__ == "error" and type(e).__module__ == "termios":
-                logging.warning(f"{port} didn't open at 9600 baud, but a different rate may work!")
-                result.append(port)
-            else:
-                raise e
+    result = [port_info.device for port_info in list_ports.comports()]
 
     # On macOS, prioritize cu.* ports over usbserial
     if sys.platform.startswith("darwin"):
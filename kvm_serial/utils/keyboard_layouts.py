@@ -5,7 +5,8 @@ This module provides keyboard layout mappings for different languages/regions.
 It uses a base layout (en_GB) with override dictionaries for layout-specific differences.
 """
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 # Base layout (en_GB ISO) - source of truth for all standard HID mappings
 # Maps ASCII characters to HID scan codes
@@ -60,30 +61,20 @@ LAYOUT_OVERRIDES: Dict[str, Dict[str, Optional[int]]] = {
 }
 
 
-def get_layout(layout_name: str) -> Dict[str, int]:
+def _merge_layout(overrides: Dict[str, Optional[int]]) -> Dict[str, int]:
     """
-    Get complete keyboard layout by merging base layout with overrides.
+    Merge a layout's overrides onto a copy of the base layout.
 
     Args:
-        layout_name: Name of the layout (e.g., 'en_US', 'en_GB')
+        overrides: Characters that differ from BASE_LAYOUT (None = unavailable)
 
     Returns:
         Dictionary mapping ASCII characters to HID scan codes
-
-    Raises:
-        ValueError: If layout_name is not recognized
     """
-    if layout_name not in LAYOUT_OVERRIDES:
-        raise ValueError(
-            f"Unknown keyboard layout: {layout_name}. "
-            f"Available layouts: {', '.join(get_available_layouts())}"
-        )
-
     # Start with base layout
     layout = BASE_LAYOUT.copy()
 
     # Apply overrides
-    overrides = LAYOUT_OVERRIDES[layout_name]
     for char, scancode in overrides.items():
         if scancode is None:
             # Remove character if marked as unavailable
@@ -95,6 +86,81 @@ def get_layout(layout_name: str) -> Dict[str, int]:
     return layout
 
 
+# Complete layouts, merged once at import time. LAYOUT_OVERRIDES is static, so
+# there is no need to rebuild the merged dict on every lookup. Wrapped in
+# read-only proxies because the same mapping is shared by every caller.
+_COMPILED_LAYOUTS: Dict[str, Mapping[str, int]] = {
+    name: MappingProxyType(_merge_layout(overrides)) for name, overrides in LAYOUT_OVERRIDES.items()
+}
+
+
+# Characters which are typed without shift held; every other character in a
+# layout needs the left shift modifier (0x2)
+UNSHIFTED_SYMBOLS = "\n\t\b -=[];';,./\\` "
+
+
+def _build_scancode_map(layout: Mapping[str, int]) -> Dict[str, Tuple[int, int]]:
+    """
+    Pair every character in a complete layout with the modifier needed to type it.
+
+    Args:
+        layout: Complete layout mapping ASCII characters to HID scan codes
+
+    Returns:
+        Dictionary mapping characters to (scan code, modifier) pairs
+    """
+    scancode_map = {}
+    for char, scancode in layout.items():
+        unshifted = char.islower() or char.isdigit() or char in UNSHIFTED_SYMBOLS
+        scancode_map[char] = (scancode, 0x0 if unshifted else 0x2)
+    return scancode_map
+
+
+_SCANCODE_MAPS: Dict[str, Mapping[str, Tuple[int, int]]] = {
+    name: MappingProxyType(_build_scancode_map(layout))
+    for name, layout in _COMPILED_LAYOUTS.items()
+}
+
+
+def get_layout(layout_name: str) -> Mapping[str, int]:
+    """
+    Get complete keyboard layout (base layout merged with overrides).
+
+    Args:
+        layout_name: Name of the layout (e.g., 'en_US', 'en_GB')
+
+    Returns:
+        Read-only mapping of ASCII characters to HID scan codes
+
+    Raises:
+        ValueError: If layout_name is not recognized
+    """
+    if layout_name not in _COMPILED_LAYOUTS:
+        raise ValueError(
+            f"Unknown keyboard layout: {layout_name}. "
+            f"Available layouts: {', '.join(get_available_layouts())}"
+        )
+
+    return _COMPILED_LAYOUTS[layout_name]
+
+
+def get_scancode_map(layout_name: str) -> Mapping[str, Tuple[int, int]]:
+    """
+    Get the precomputed (scan code, modifier) pair for every character in a layout.
+
+    Args:
+        layout_name: Name of the layout (e.g., 'en_US', 'en_GB')
+
+    Returns:
+        Read-only mapping of characters to (scan code, modifier) pairs
+
+    Raises:
+        ValueError: If layout_name is not recognized
+    """
+    get_layout(layout_name)  # Validates the name
+    return _SCANCODE_MAPS[layout_name]
+
+
 def get_available_layouts() -> list[str]:
     """
     Get list of available keyboard layouts.
@@ -1,7 +1,62 @@
 import configparser
+import hashlib
 import os
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+# Parsed INI files, keyed by path. Each entry records a hash of the file's
+# contents when it was parsed, so an unchanged file is never parsed twice.
+_config_cache: Dict[str, Tuple[bytes, Dict[str, Dict[str, str]]]] = {}
+
+
+def _content_hash(text: str) -> bytes:
+    return hashlib.sha256(text.encode()).digest()
+
+
+def _read_config(config_file: str) -> Dict[str, Dict[str, str]]:
+    """
+    Parse an INI file into a plain {section: {key: value}} dict.
+    [DEFAULT] is kept as its own section, and other sections hold only the
+    values they set themselves. The result is cached until the file's
+    contents change. Returns an empty dict if the file does not exist.
+    """
+    if not os.path.exists(config_file):
+        return {}
+
+    with open(config_file) as f:
+        text = f.read()
+    signature = _content_hash(text)
+    cached = _config_cache.get(config_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    config = configparser.ConfigParser()
+    config.read_string(text, source=config_file)
+    defaults = dict(config[configparser.DEFAULTSECT])
+    sections = {}
+    if defaults:
+        sections[configparser.DEFAULTSECT] = defaults
+    for name in config.sections():
+        # ConfigParser merges [DEFAULT] into every section; keep only overrides
+        sections[name] = {k: v for k, v in config[name].items() if defaults.get(k) != v}
+    _config_cache[config_file] = (signature, sections)
+    return sections
+
+
+def _render_config(sections: Dict[str, Dict[str, str]]) -> str:
+    """Render sections in the same layout ConfigParser.write() produces."""
+    # ConfigParser.write() puts [DEFAULT] first
+    ordered = sorted(sections.items(), key=lambda item: item[0] != configparser.DEFAULTSECT)
+    lines = []
+    for name, items in ordered:
+        lines.append(f"[{name}]\n")
+        for key, value in items.items():
+            # Values are read back with ConfigParser's interpolation, so a literal
+            # "%" must be escaped; multi-line values continue on indented lines
+            value = str(value).replace("%", "%%").replace("\n", "\n\t")
+            lines.append(f"{key} = {value}\n")
+        lines.append("\n")
+    return "".join(lines)
 
 
 def load_settings(
@@ -11,13 +66,11 @@ def load_settings(
     Load settings from an INI file. Returns a dict of settings for the given section.
     If the file or section does not exist, returns defaults (if provided) or empty dict.
     """
-    config = configparser.ConfigParser()
-    if not os.path.exists(config_file):
-        return defaults.copy() if defaults is not None else {}
-    config.read(config_file)
+    config = _read_config(config_file)
     if section not in config:
         return defaults.copy() if defaults is not None else {}
-    settings = dict(config[section])
+    settings = dict(config.get(configparser.DEFAULTSECT, {}))
+    settings.update(config[section])
     # Overlay defaults for missing keys
     if defaults is not None:
         for k, v in defaults.items():
@@ -29,11 +82,34 @@ def load_settings(
 def save_settings(config_file: str, section: str, settings: Dict[str, Any]) -> None:
     """
     Save settings to an INI file under the given section.
+    Other sections already present in the file are preserved.
     """
-    config = configparser.ConfigParser()
-    if os.path.exists(config_file):
-        config.read(config_file)
-    config[section] = {k: str(v) for k, v in settings.items()}
+    sections = dict(_read_config(config_file))
+    # Lowercase keys as ConfigParser.optionxform() would, so the cache matches a re-read
+    sections[section] = {str(k).lower(): str(v) for k, v in settings.items()}
+    text = _render_config(sections)
     with open(config_file, "w") as f:
-        config.write(f)
+        f.write(text)
+    _config_cache[config_file] = (_content_hash(text), sections)
     logging.info(f"Settings saved to {config_file} [{section}]")
+
+
+def get_bool(settings: Mapping[str, Any], key: str, default: bool) -> bool:
+    """
+    Read a boolean setting. Only "True", as written by save_settings(), reads as
+    True; any other value is False. A missing value yields default.
+    """
+    value = settings.get(key)
+    if value is None:
+        return default
+    return str(value) == "True"
+
+
+def get_int(settings: Mapping[str, Any], key: str, default: Optional[int] = None) -> Optional[int]:
+    """
+    Read an integer setting. A missing or non-numeric value yields default.
+    """
+    try:
+        return int(settings[key])
+    except (KeyError, TypeError, ValueError):
+        return default
@@ -182,6 +182,22 @@ class TestCursesOperation:
             mock_term.addstr.assert_called_once()
             op._mock_ascii.assert_called_with(key, layout="en_GB")
 
+    def test_cursesop_parse_key_beyond_control_range(self, op, sys_modules_patch, mock_term):
+        """Characters past the control character table fall through to ascii_to_scancode"""
+
+        key = "£"
+        scancode = array("B", [0x2, 0, 0x20, 0, 0, 0, 0, 0])
+
+        with patch.dict("sys.modules", sys_modules_patch):
+            mock_term.set_keys([key])
+            op._mock_ascii.return_value = scancode
+            returnval = op._parse_key(mock_term)
+
+            assert returnval == True
+            assert op.sc == scancode
+            op._mock_build.assert_not_called()
+            op._mock_ascii.assert_called_with(key, layout="en_GB")
+
     def test_cursesop_parse_key_control_characters(self, op, sys_modules_patch, mock_term):
         """Send a control character, and check object state afterwards"""
         with patch.dict("sys.modules", sys_modules_patch):
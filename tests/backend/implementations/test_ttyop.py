@@ -1,45 +1,46 @@
 import sys
 import pytest
+from importlib import import_module
 from unittest.mock import patch, MagicMock
-from tests._utilities import MockSerial, mock_serial
+from tests._utilities import mock_serial
 
 CLASS_PATH = "kvm_serial.backend.implementations.ttyop"
 
 
-@pytest.fixture
-def sys_modules_patch():
-    return {
+# Mock tty and termios once for the whole module rather than around every test.
+# ttyop binds them at import, so tests reach the mocks through the module object.
+@pytest.fixture(scope="module")
+def ttyop_mod():
+    """The ttyop module, imported once with tty and termios mocked out in sys.modules"""
+    sys_modules_patch = {
         "tty": MagicMock(),
         "termios": MagicMock(),
     }
+    with patch.dict("sys.modules", sys_modules_patch):
+        yield import_module(CLASS_PATH)
 
 
-@patch("serial.Serial", MockSerial)
 class TestTTYOperation:
 
     class MockTermiosError(Exception):
         """A mock exception class replacing termios.error"""
 
     @pytest.fixture
-    def op(self, mock_serial, sys_modules_patch):
+    def op(self, mock_serial, ttyop_mod):
         """
         Fixture that creates and configures a TtyOp instance for testing.
         """
-        with patch.dict("sys.modules", sys_modules_patch):
-            from kvm_serial.backend.implementations.ttyop import TtyOp
+        op = ttyop_mod.TtyOp(mock_serial)
+        op.hid_serial_out = MagicMock()
+        return op
 
-            op = TtyOp(mock_serial)
-            op.hid_serial_out = MagicMock()
-            return op
-
-    def test_ttyop_name_property(self, op, sys_modules_patch):
+    def test_ttyop_name_property(self, op):
         """
         Test that the 'name' property of TtyOp returns 'tty'.
         """
-        with patch.dict("sys.modules", sys_modules_patch):
-            assert op.name == "tty"
+        assert op.name == "tty"
 
-    def test_ttyop_input_loop(self, op, sys_modules_patch):
+    def test_ttyop_input_loop(self, op, ttyop_mod):
         """
         Test that run() calls tty.setcbreak, enters the input loop, and calls time.sleep.
         Mocks:
@@ -52,18 +53,16 @@ class TestTTYOperation:
 
         # Patch _parse_key for two iterations, and time.sleep for checking
         with (
-            patch.dict("sys.modules", sys_modules_patch),
+            patch.object(ttyop_mod.tty, "setcbreak") as mock_setcbreak,
             patch.object(op, "_parse_key", side_effect=[True, False]),
             patch("time.sleep") as mock_sleep,
         ):
-            import tty as mock_tty
-
             op.run()
-            mock_tty.setcbreak.assert_called_once()
+            mock_setcbreak.assert_called_once()
             # Loop exited on second call means sleep called once:
             mock_sleep.assert_called_once()
 
-    def test_ttyop_run_termios_error(self, op, sys_modules_patch):
+    def test_ttyop_run_termios_error(self, op, ttyop_mod):
         """
         Test that run() raises Exception if termios.error is raised by tty.setcbreak.
         Mocks:
@@ -74,18 +73,15 @@ class TestTTYOperation:
         """
 
         # Patch termios.error to the class, and tty.setcbreak to raise it
-        with patch.dict("sys.modules", sys_modules_patch):
-            import termios, tty
-
-            with (
-                patch.object(termios, "error", self.MockTermiosError),
-                patch.object(tty, "setcbreak", side_effect=self.MockTermiosError),
-            ):
-                with pytest.raises(Exception) as e:
-                    op.run()
-                    assert "Run this app from a terminal!" in str(e.value)
-
-    def test_ttyop_parse_key(self, caplog, sys_modules_patch, mock_serial):
+        with (
+            patch.object(ttyop_mod.termios, "error", self.MockTermiosError),
+            patch.object(ttyop_mod.tty, "setcbreak", side_effect=self.MockTermiosError),
+        ):
+            with pytest.raises(Exception) as e:
+                op.run()
+                assert "Run this app from a terminal!" in str(e.value)
+
+    def test_ttyop_parse_key(self, caplog, ttyop_mod, mock_serial):
         """
         Test that _parse_key reads a character, converts it to a scancode, logs, and sends it.
         Mocks:
@@ -98,37 +94,34 @@ class TestTTYOperation:
             - hid_serial_out.release is called once
             - _parse_key returns True
         """
-        with patch.dict("sys.modules", sys_modules_patch):
-            from kvm_serial.backend.implementations import ttyop as ttyop_mod
+        with patch.object(ttyop_mod, "ascii_to_scancode") as mock_scancode:
+            mock_scancode.return_value = [0, 0, 42, 0, 0, 0, 0, 0]
 
-            with patch.object(ttyop_mod, "ascii_to_scancode") as mock_scancode:
-                mock_scancode.return_value = [0, 0, 42, 0, 0, 0, 0, 0]
-
-                # We cannot use the op mock here, because ascii_to_scancode will already be initialised
-                # when TtyOp is, resulting in a patching failure. We must re-create it here.
-                op = ttyop_mod.TtyOp(mock_serial)
-                op.hid_serial_out = MagicMock()
+            # We cannot use the op mock here, because ascii_to_scancode will already be initialised
+            # when TtyOp is, resulting in a patching failure. We must re-create it here.
+            op = ttyop_mod.TtyOp(mock_serial)
+            op.hid_serial_out = MagicMock()
 
-                with patch.object(sys.stdin, "read", lambda n=-1: "a"):
-                    with caplog.at_level("DEBUG"):
-                        assert op._parse_key() is True
+            with patch.object(sys.stdin, "read", lambda n=-1: "a"):
+                with caplog.at_level("DEBUG"):
+                    assert op._parse_key() is True
 
-                # Mock ascii_to_scancode called once with 'a' and layout parameter
-                mock_scancode.assert_called_once_with("a", layout="en_GB")
+            # Mock ascii_to_scancode called once with 'a' and layout parameter
+            mock_scancode.assert_called_once_with("a", layout="en_GB")
 
-                # Assert scancode logged at DEBUG level
-                assert any(
-                    "42" in record.getMessage() and record.levelname == "DEBUG"
-                    for record in caplog.records
-                )
+            # Assert scancode logged at DEBUG level
+            assert any(
+                "42" in record.getMessage() and record.levelname == "DEBUG"
+                for record in caplog.records
+            )
 
-                # Assert hid_serial_out.send_scancode and release called
-                op.hid_serial_out.send_scancode.assert_called_once_with(
-                    bytes(mock_scancode.return_value)
-                )
-                op.hid_serial_out.release.assert_called_once()
+            # Assert hid_serial_out.send_scancode and release called
+            op.hid_serial_out.send_scancode.assert_called_once_with(
+                bytes(mock_scancode.return_value)
+            )
+            op.hid_serial_out.release.assert_called_once()
 
-    def test_legacy_main_tty(self, mock_serial, sys_modules_patch):
+    def test_legacy_main_tty(self, mock_serial, ttyop_mod):
         """
         Test that main_tty instantiates TtyOp, calls run, and returns None.
         Mocks:
@@ -138,11 +131,8 @@ class TestTTYOperation:
             - run() called once
             - main_tty returns None
         """
-        with patch.dict("sys.modules", sys_modules_patch):
-            from kvm_serial.backend.implementations import ttyop as ttyop_mod
-
-            with patch.object(ttyop_mod, "TtyOp") as mock_op:
-                mock_op.return_value.run.return_value = None
-                assert ttyop_mod.main_tty(mock_serial) is None
-                mock_op.assert_called_once_with(mock_serial)
-                mock_op.return_value.run.assert_called_once()
+        with patch.object(ttyop_mod, "TtyOp") as mock_op:
+            mock_op.return_value.run.return_value = None
+            assert ttyop_mod.main_tty(mock_serial) is None
+            mock_op.assert_called_once_with(mock_serial)
+            mock_op.return_value.run.assert_called_once()
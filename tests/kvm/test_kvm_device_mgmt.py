@@ -84,6 +84,57 @@ class TestKVMDeviceManagement(
             self.assertEqual(app.serial_ports, [])
             self.assertEqual(app.serial_port_var, "Error")
 
+    def _make_serial_port_menu(self, app):
+        """Wire a menu that tracks its actions, plus a fake QAction factory, onto app."""
+        actions = []
+        menu = MagicMock()
+        menu.addAction.side_effect = actions.append
+        menu.removeAction.side_effect = actions.remove
+        menu.actions.side_effect = lambda: list(actions)
+        app.serial_port_menu = menu
+        return menu, patch("kvm_serial.kvm.QAction", side_effect=_FakeQAction)
+
+    def test_serial_port_menu_skips_unchanged_rebuild(self):
+        """The serial menu is only updated when the ports or selection change."""
+        app = self.create_kvm_app()
+        app.serial_ports = self.create_mock_serial_ports()
+        app.serial_port_var = app.serial_ports[0]
+        menu, qaction_patch = self._make_serial_port_menu(app)
+
+        with qaction_patch:
+            app._populate_serial_port_menu()
+            app._populate_serial_port_menu()
+            self.assertEqual(menu.actions.call_count, 1)
+
+            app.serial_port_var = app.serial_ports[1]
+            app._populate_serial_port_menu()
+            self.assertEqual(menu.actions.call_count, 2)
+            self.assertEqual([a.isChecked() for a in menu.actions()], [False, True, False])
+
+    def test_serial_port_menu_updates_actions_in_place(self):
+        """Existing actions are relabelled; only the difference is added or removed."""
+        app = self.create_kvm_app()
+        app.serial_ports = ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        menu, qaction_patch = self._make_serial_port_menu(app)
+
+        with qaction_patch as mock_qaction:
+            app._populate_serial_port_menu()
+            first = menu.actions()
+            self.assertEqual(mock_qaction.call_count, 2)
+
+            app.serial_ports = ["/dev/ttyACM0", "/dev/ttyUSB1", "/dev/ttyS0"]
+            app.serial_port_var = "/dev/ttyS0"
+            app._populate_serial_port_menu()
+            self.assertEqual(mock_qaction.call_count, 3)
+            self.assertIs(menu.actions()[0], first[0])
+            self.assertEqual([a.text() for a in menu.actions()], app.serial_ports)
+            self.assertEqual([a.isChecked() for a in menu.actions()], [False, False, True])
+
+            app.serial_ports = ["/dev/ttyACM0"]
+            app._populate_serial_port_menu()
+            self.assertEqual(menu.actions(), [first[0]])
+            self.assertEqual(mock_qaction.call_count, 3)
+
     def test_serial_port_selection(self):
         """Test serial port selection logic."""
         app = self.create_kvm_app()
@@ -386,9 +437,15 @@ class _FakeQAction:
     def text(self):
         return self._text
 
+    def setText(self, label):
+        self._text = label
+
     def setCheckable(self, v):
         self._checkable = v
 
+    def deleteLater(self):
+        pass
+
     def isChecked(self):
         return self._checked
 
@@ -125,6 +125,48 @@ class TestKVMEventHandling(
                 # Mouse operation should not be called
                 mock_mouse_op.on_move.assert_not_called()
 
+    def test_mouse_move_coalescing(self):
+        """Test rapid mouse moves are coalesced so only the latest is sent."""
+        app = self.create_kvm_app()
+        mock_mouse_op = MagicMock()
+        app.mouse_op = mock_mouse_op
+        app._camera_resolution = MagicMock(return_value=(1280, 720))
+
+        with patch("kvm_serial.kvm.QTimer.singleShot") as mock_single_shot:
+            # First move is sent straight away and starts the throttle interval
+            app._on_mouse_move(10, 10)
+            mock_mouse_op.on_move.assert_called_once_with(10, 10, 1280, 720)
+            mock_single_shot.assert_called_once_with(
+                app.MOUSE_MOVE_INTERVAL_MS, app._flush_mouse_move
+            )
+
+            # Moves inside the interval only replace the pending position
+            app._on_mouse_move(20, 20)
+            app._on_mouse_move(30, 30)
+            self.assertEqual(mock_mouse_op.on_move.call_count, 1)
+
+            # When the interval elapses, only the latest position is sent
+            app._flush_mouse_move()
+            self.assertEqual(mock_mouse_op.on_move.call_count, 2)
+            mock_mouse_op.on_move.assert_called_with(30, 30, 1280, 720)
+
+            # A quiet interval releases the throttle
+            app._flush_mouse_move()
+            app._on_mouse_move(40, 40)
+            mock_mouse_op.on_move.assert_called_with(40, 40, 1280, 720)
+
+    def test_mouse_click_sends_pending_move_first(self):
+        """Test a click lands any coalesced move before the button report."""
+        app = self.create_kvm_app()
+        mock_mouse_op = MagicMock()
+        app.mouse_op = mock_mouse_op
+        app._pending_mouse_move = (30, 30, 1280, 720)
+
+        app._on_mouse_click(30, 30, Qt.MouseButton.LeftButton, True)
+
+        self.assertEqual([c[0] for c in mock_mouse_op.method_calls], ["on_move", "on_click"])
+        self.assertIsNone(app._pending_mouse_move)
+
     def test_mouse_move_exception_handling(self):
         """Test exception handling during mouse move operations."""
         app = self.create_kvm_app()
@@ -352,6 +394,35 @@ class TestKVMEventHandling(
             self.assertTrue(app._quitting)
             mock_close.assert_called_once()
 
+    def test_status_bar_skips_unchanged_update(self):
+        """Status bar labels are only rewritten when one of their inputs changes."""
+        app = self.create_kvm_app()
+        app.status_serial_label = MagicMock()
+
+        with patch.object(app, "_camera_resolution", return_value=(1280, 720)):
+            app._update_status_bar()
+            app._update_status_bar()
+            self.assertEqual(app.status_serial_label.setText.call_count, 1)
+
+            app.pos_x = 10
+            app._update_status_bar()
+            self.assertEqual(app.status_serial_label.setText.call_count, 2)
+
+    def test_status_bar_follows_replaced_video_device(self):
+        """A device swapped in at the same index updates the video label."""
+        app = self.create_kvm_app()
+        app.status_video_label = MagicMock()
+        app.video_devices = ["Camera A"]
+        app.video_var = 0
+
+        with patch.object(app, "_camera_resolution", return_value=(1280, 720)):
+            app._update_status_bar()
+            app.video_devices = ["Camera B"]
+            app._update_status_bar()
+
+        app.status_video_label.setText.assert_called_with("Video: Camera B")
+        self.assertEqual(app.status_video_label.setText.call_count, 2)
+
     def test_mouse_pointer_visibility_toggle(self):
         """Test mouse pointer visibility toggle functionality."""
         app = self.create_kvm_app()
@@ -390,6 +461,8 @@ class TestKVMEventHandling(
             with self.subTest(test=description):
                 mock_mouse_op.reset_mock()
                 result = app._on_mouse_move(x, y)
+                # Let the move throttle interval elapse before the next subtest
+                app._flush_mouse_move()
 
                 if should_succeed:
                     self.assertNotEqual(result, False)
@@ -153,8 +153,32 @@ class TestKVMPaste(KVMTestBase):
         ):
             app._on_paste()
 
-            # Should call string_to_scancodes with the clipboard text
-            mock_convert.assert_called_once_with("ab", key_repeat=1, key_up=1)
+            # Should call string_to_scancodes with the clipboard text and selected layout
+            mock_convert.assert_called_once_with(
+                "ab", key_repeat=1, key_up=1, layout=app.keyboard_layout_var
+            )
+
+    def test_paste_uses_selected_keyboard_layout(self):
+        """Test that pasted text is converted using the selected keyboard layout."""
+        app = self.create_kvm_app()
+        mock_keyboard_op = MagicMock()
+        app.keyboard_op = mock_keyboard_op
+        app.paste_action = MagicMock()
+        app.keyboard_layout_var = "en_US"
+
+        # '@' is Shift+2 on en_US, but Shift+' on en_GB
+        mock_clipboard = MagicMock()
+        mock_clipboard.text.return_value = "@"
+
+        with (
+            patch("kvm_serial.kvm.QApplication.clipboard", return_value=mock_clipboard),
+            patch("kvm_serial.kvm.QTimer.singleShot"),
+        ):
+            app._on_paste()
+
+        mock_keyboard_op.hid_serial_out.send_scancode.assert_called_once_with(
+            bytes([0x02, 0, 0x1F, 0, 0, 0, 0, 0])
+        )
 
     def test_paste_handles_clipboard_access_failure(self):
         """Test paste handles clipboard access returning None gracefully."""
@@ -574,6 +574,19 @@ class TestCH9350CommInternals:
         assert dc._tx_thread is None
         assert dc._rx_thread is None
 
+    def test_start_sets_read_timeout_before_threads(self, mock_serial):
+        """The rx read timeout is set on the port once, before any thread starts."""
+        dc = CH9350Comm(mock_serial, state=0)
+        timeouts = []
+        with (
+            patch.object(dc, "_rx_loop", side_effect=lambda: timeouts.append(mock_serial.timeout)),
+            patch.object(dc, "_tx_maint_loop"),
+        ):
+            dc.start()
+        dc.stop()
+        assert mock_serial.timeout == CH9350Comm.RECV_TIMEOUT
+        assert timeouts == [CH9350Comm.RECV_TIMEOUT]
+
     def test_start_state2_no_tx_thread(self, mock_serial):
         """States 2/3/4 spawn the rx thread but no tx-maintenance thread."""
         dc = CH9350Comm(mock_serial, state=2)
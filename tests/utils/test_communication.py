@@ -1,42 +1,37 @@
 import pytest
-import termios
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from kvm_serial.utils import communication
+from kvm_serial.utils.ch9329 import CH9329Comm
 from kvm_serial.utils.communication import list_serial_ports
 
 from tests._utilities import MockSerial, mock_serial
 
 
+def _comports(*devices):
+    """Build a fake list_ports.comports() return value for the given device names."""
+    return [SimpleNamespace(device=d) for d in devices]
+
+
 class TestListSerialPorts:
-    """Test suite for the cross-platform list_serial_ports() helper.
-
-    All tests in this suite are currently skipped — they predate the move to
-    pyserial's list_ports API and need rewriting to mock that surface rather
-    than the prior glob-based enumeration. Kept in place as a TODO marker.
-    """
-
-    # TODO: fix to correctly use mock.
-    @pytest.mark.skip("Broken: serial.Serial imported; fix to use mock.")
-    @patch("kvm_serial.utils.communication.glob.glob")
-    @patch("serial.Serial", MockSerial)
-    @patch("kvm_serial.utils.communication.sys.platform", "darwin")
-    def test_list_serial_ports_osx(self, mock_glob):
+    """Test suite for the cross-platform list_serial_ports() helper."""
+
+    @patch.object(communication.list_ports, "comports")
+    @patch.object(communication.sys, "platform", "darwin")
+    def test_list_serial_ports_osx(self, mock_comports):
         """Test serial port enumeration on macOS/OSX.
 
         Verifies re-ordering functionality (usbserial devices come last)
         """
-
-        mock_glob.return_value = ["/dev/cu.usbserial-1234", "/dev/cu.Bluetooth-123"]
+        mock_comports.return_value = _comports("/dev/cu.usbserial-1234", "/dev/cu.Bluetooth-123")
         ports = list_serial_ports()
         # Should return ports with those matching cu.usbserial* last.
         assert len(ports) == 2
         assert ports == ["/dev/cu.Bluetooth-123", "/dev/cu.usbserial-1234"]
 
-    # TODO: fix to correctly use mock.
-    @pytest.mark.skip("Broken: serial.Serial imported; fix to use mock.")
-    @patch("kvm_serial.utils.communication.glob.glob")
-    @patch("serial.Serial", MockSerial)
-    @patch("kvm_serial.utils.communication.sys.platform", "linux")
-    def test_list_serial_ports_linux(self, mock_glob):
+    @patch.object(communication.list_ports, "comports")
+    @patch.object(communication.sys, "platform", "linux")
+    def test_list_serial_ports_linux(self, mock_comports):
         """Test serial port enumeration on Linux.
 
         Tests detection of various Linux serial devices:
@@ -44,63 +39,56 @@ class TestListSerialPorts:
         - /dev/ttyACM* (USB ACM devices)
         - /dev/ttyS* (Built-in serial ports)
         """
-        mock_glob.return_value = ["/dev/ttyUSB0", "/dev/ttyACM0", "/dev/ttyS0"]
-        ports = list_serial_ports()
-        assert ports == mock_glob.return_value
-
-    # TODO: fix to correctly use mock.
-    @pytest.mark.skip("Broken: serial.Serial imported; fix to use mock.")
-    @patch("serial.Serial", MockSerial)
-    @patch("kvm_serial.utils.communication.sys.platform", "win32")
-    def test_list_serial_ports_windows(self, mock_serial):
-        """Test serial port enumeration on Windows.
-
-        Tests COM port detection by:
-        1. Simulating available ports (COM1, COM3)
-        2. Simulating unavailable ports (COM2)
-        3. Verifying correct port enumeration and ordering
-
-        Uses side_effect to control port availability through SerialException.
-        """
-
-        # Pretend COM1 and COM3 exist, but not COM2
-        _unpatched_init = MockSerial.__init__
-
-        def mock_serial_init(self, port=None):
-            from serial import SerialException
-
-            if port not in ["COM1", "COM3"]:
-                raise SerialException(f"Could not open port {port}")
-            _unpatched_init(self, port)
-
-        mock_serial.side_effect = mock_serial_init
-
-        with patch.object(MockSerial, "__init__", mock_serial_init):
-            ports = list_serial_ports()
-            assert ports == ["COM1", "COM3"]
-            assert "COM2" not in ports
-            assert len(ports) == 2
-
-    # TODO: fix to correctly use mock.
-    @pytest.mark.skip("Broken: serial.Serial imported; fix to use mock.")
-    @patch("kvm_serial.utils.communication.serial.Serial")
-    @patch("kvm_serial.utils.communication.glob.glob")
-    @patch("kvm_serial.utils.communication.sys.platform", "linux")
-    def test_exceptions(self, mock_glob, mock_serial):
-        """Test exceptions are raised when they should be:
-        #L116 - termios.error
-        #L119 - Exception
-        """
-        mock_glob.return_value = ["/dev/ttyUSB0"]
-
-        # Test termios error case
-        mock_serial.side_effect = termios.error("Simulated termios error")
-        ports = list_serial_ports()
-        # Verify port is still added despite termios error
-        assert ports == ["/dev/ttyUSB0"]
-
-        mock_serial.reset_mock()
-        mock_serial.side_effect = Exception("Simulated critical error")
-        with pytest.raises(Exception) as exc_info:
-            list_serial_ports()
-        assert "Simulated critical error" in str(exc_info.value)
+        devices = ["/dev/ttyUSB0", "/dev/ttyACM0", "/dev/ttyS0"]
+        mock_comports.return_value = _comports(*devices)
+        assert list_serial_ports() == devices
+
+    @patch.object(communication, "Serial")
+    @patch.object(communication.list_ports, "comports")
+    @patch.object(communication.sys, "platform", "win32")
+    def test_list_serial_ports_does_not_open_ports(self, mock_comports, mock_serial):
+        """Enumeration must trust comports() and never open a port: opening
+        Bluetooth COM ports can block for seconds each."""
+        mock_comports.return_value = _comports("COM1", "COM2", "COM3")
+        assert list_serial_ports() == ["COM1", "COM2", "COM3"]
+        mock_serial.assert_not_called()
+
+
+class TestRecvResponse:
+    """Test suite for DataComm.recv_response() bounded reads."""
+
+    def test_returns_buffered_bytes_without_waiting_for_full_read(self):
+        """The first byte is awaited, then only what is already buffered is taken"""
+        port = MagicMock(timeout=0.1, in_waiting=3)
+        port.read.side_effect = [b"\x57", b"\xab\x01\x02"]
+        dc = CH9329Comm(port)
+
+        assert dc.recv_response(64) == b"\x57\xab\x01\x02"
+        assert [c.args for c in port.read.call_args_list] == [(1,), (3,)]
+
+    def test_timeout_returns_empty(self):
+        """Nothing arriving within the timeout yields empty bytes"""
+        port = MagicMock(timeout=0.1, in_waiting=0)
+        port.read.return_value = b""
+        dc = CH9329Comm(port)
+
+        assert dc.recv_response() == b""
+        port.read.assert_called_once_with(1)
+
+    def test_does_not_reconfigure_port(self):
+        """Reading leaves the port timeout alone, as setting it reconfigures the device"""
+        port = MagicMock(timeout=None, in_waiting=0)
+        port.read.return_value = b""
+        dc = CH9329Comm(port)
+
+        dc.recv_response()
+        assert port.timeout is None
+
+    def test_respects_expected_len(self):
+        """No more than expected_len bytes are read in one call"""
+        port = MagicMock(timeout=0.1, in_waiting=100)
+        port.read.side_effect = [b"\x57", b"\x00" * 6]
+        dc = CH9329Comm(port)
+
+        assert len(dc.recv_response(7)) == 7
+        port.read.assert_called_with(6)
@@ -3,9 +3,11 @@ Unit tests for keyboard layout functionality.
 """
 
 import pytest
+from collections.abc import Mapping
 from kvm_serial.utils.keyboard_layouts import (
     get_layout,
     get_available_layouts,
+    get_scancode_map,
     BASE_LAYOUT,
     LAYOUT_OVERRIDES,
 )
@@ -27,7 +29,7 @@ class TestKeyboardLayouts:
     def test_get_layout_en_gb(self):
         """Test getting en_GB layout returns base layout."""
         layout = get_layout("en_GB")
-        assert isinstance(layout, dict)
+        assert isinstance(layout, Mapping)
         # Should have all base mappings
         assert layout["a"] == 0x04
         assert layout["@"] == 0x34
@@ -39,7 +41,7 @@ class TestKeyboardLayouts:
     def test_get_layout_en_us(self):
         """Test getting en_US layout with overrides applied."""
         layout = get_layout("en_US")
-        assert isinstance(layout, dict)
+        assert isinstance(layout, Mapping)
         # Should have overridden mappings
         assert layout["a"] == 0x04  # Same as base
         assert layout['"'] == 0x34  # US override
@@ -55,6 +57,25 @@ class TestKeyboardLayouts:
         get_layout("en_US")
         assert BASE_LAYOUT == original_base
 
+    def test_layout_is_shared_and_read_only(self):
+        """Test that layouts are merged once and can't be mutated by callers."""
+        layout = get_layout("en_US")
+        assert get_layout("en_US") is layout
+        with pytest.raises(TypeError):
+            layout["a"] = 0x05  # type: ignore[index]
+
+    def test_scancode_map(self):
+        """Test every layout character is paired with the modifier needed to type it."""
+        scancode_map = get_scancode_map("en_US")
+        assert scancode_map["2"] == (0x1F, 0x0)
+        assert scancode_map["@"] == (0x1F, 0x2)
+        assert "£" not in scancode_map
+        assert set(scancode_map) == set(get_layout("en_US"))
+        with pytest.raises(TypeError):
+            scancode_map["a"] = (0x05, 0x0)  # type: ignore[index]
+        with pytest.raises(ValueError):
+            get_scancode_map("invalid_layout")
+
     def test_invalid_layout(self):
         """Test that requesting invalid layout raises ValueError."""
         with pytest.raises(ValueError) as excinfo:
@@ -0,0 +1,156 @@
+import configparser
+import os
+import pytest
+from unittest.mock import patch
+from kvm_serial.utils import settings as settings_util
+from kvm_serial.utils.settings import get_bool, get_int, load_settings, save_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Drop parsed INI files so tests don't see each other's cached state."""
+    settings_util._config_cache.clear()
+    yield
+    settings_util._config_cache.clear()
+
+
+class TestSettings:
+    """Test suite for INI-backed settings persistence."""
+
+    def test_missing_file_returns_defaults(self, tmp_path):
+        """A config file which doesn't exist yields a copy of the defaults"""
+        defaults = {"baud_rate": "9600"}
+        result = load_settings(str(tmp_path / "missing.ini"), "KVM", defaults)
+        assert result == defaults
+        assert result is not defaults
+        assert load_settings(str(tmp_path / "missing.ini"), "KVM") == {}
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """Saved values are written as strings and read back unchanged"""
+        config_file = str(tmp_path / "settings.ini")
+        save_settings(config_file, "KVM", {"serial_port": "/dev/ttyUSB0", "baud_rate": 9600})
+
+        settings_util._config_cache.clear()
+        assert load_settings(config_file, "KVM") == {
+            "serial_port": "/dev/ttyUSB0",
+            "baud_rate": "9600",
+        }
+
+    def test_saved_file_is_valid_ini(self, tmp_path):
+        """The hand-rendered file must still parse with ConfigParser"""
+        config_file = str(tmp_path / "settings.ini")
+        save_settings(config_file, "KVM", {"windowed": True, "verbose": False})
+
+        config = configparser.ConfigParser()
+        config.read(config_file)
+        assert dict(config["KVM"]) == {"windowed": "True", "verbose": "False"}
+
+    def test_save_preserves_other_sections(self, tmp_path):
+        """Saving one section must not drop the others already in the file"""
+        config_file = tmp_path / "settings.ini"
+        config_file.write_text("[Other]\nkey = value\n\n[KVM]\nbaud_rate = 1200\n")
+
+        save_settings(str(config_file), "KVM", {"baud_rate": 9600})
+
+        config = configparser.ConfigParser()
+        config.read(config_file)
+        assert dict(config["Other"]) == {"key": "value"}
+        assert dict(config["KVM"]) == {"baud_rate": "9600"}
+
+    def test_percent_and_key_case_round_trip(self, tmp_path):
+        """A literal % survives save and load; keys are lowercased like ConfigParser's"""
+        config_file = tmp_path / "settings.ini"
+        save_settings(str(config_file), "KVM", {"Serial_Port": "/dev/tty%1"})
+        assert "serial_port = /dev/tty%%1" in config_file.read_text()
+
+        settings_util._config_cache.clear()
+        assert load_settings(str(config_file), "KVM") == {"serial_port": "/dev/tty%1"}
+
+        # Re-saving another section must keep the escaped value intact
+        save_settings(str(config_file), "Other", {"key": "value"})
+        settings_util._config_cache.clear()
+        assert load_settings(str(config_file), "KVM") == {"serial_port": "/dev/tty%1"}
+
+    def test_load_defaults_overlay(self, tmp_path):
+        """Defaults fill in keys that are missing from the file"""
+        config_file = tmp_path / "settings.ini"
+        config_file.write_text("[KVM]\nbaud_rate = 1200\n")
+
+        result = load_settings(str(config_file), "KVM", {"baud_rate": "9600", "verbose": "False"})
+        assert result == {"baud_rate": "1200", "verbose": "False"}
+
+    def test_default_section_is_preserved(self, tmp_path):
+        """[DEFAULT] stays its own section on save and still applies on load"""
+        config_file = tmp_path / "settings.ini"
+        config_file.write_text("[DEFAULT]\nverbose = True\n\n[Other]\nkey = value\n")
+
+        save_settings(str(config_file), "KVM", {"baud_rate": 9600})
+
+        text = config_file.read_text()
+        assert text.startswith("[DEFAULT]\nverbose = True\n")
+        assert text.count("verbose") == 1
+
+        settings_util._config_cache.clear()
+        assert load_settings(str(config_file), "KVM") == {"baud_rate": "9600", "verbose": "True"}
+        assert load_settings(str(config_file), "Other") == {"key": "value", "verbose": "True"}
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Repeat loads of an unmodified file reuse the parsed result"""
+        config_file = tmp_path / "settings.ini"
+        config_file.write_text("[KVM]\nbaud_rate = 1200\n")
+
+        with patch.object(
+            settings_util.configparser.ConfigParser,
+            "read_string",
+            autospec=True,
+            side_effect=configparser.ConfigParser.read_string,
+        ) as mock_read:
+            load_settings(str(config_file), "KVM")
+            load_settings(str(config_file), "KVM")
+            assert mock_read.call_count == 1
+
+            config_file.write_text("[KVM]\nbaud_rate = 115200\n")
+            assert load_settings(str(config_file), "KVM") == {"baud_rate": "115200"}
+            assert mock_read.call_count == 2
+
+    def test_same_size_edit_with_unchanged_mtime_is_reloaded(self, tmp_path):
+        """An edit that keeps the file's size and timestamp is still picked up"""
+        config_file = tmp_path / "settings.ini"
+        config_file.write_text("[KVM]\nbaud_rate = 1200\n")
+        stat = os.stat(config_file)
+        assert load_settings(str(config_file), "KVM") == {"baud_rate": "1200"}
+
+        config_file.write_text("[KVM]\nbaud_rate = 4800\n")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert load_settings(str(config_file), "KVM") == {"baud_rate": "4800"}
+
+
+class TestTypedAccessors:
+    """Test suite for the get_bool()/get_int() setting readers."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("True", True),
+            (True, True),
+            ("False", False),
+            ("true", False),
+            ("yes", False),
+            ("1", False),
+            ("", False),
+        ],
+    )
+    def test_get_bool(self, value, expected):
+        """Only the exact "True" written by save_settings() reads as True"""
+        assert get_bool({"verbose": value}, "verbose", not expected) is expected
+
+    def test_get_bool_default(self):
+        """Missing booleans yield the default"""
+        assert get_bool({}, "statusbar", True) is True
+        assert get_bool({}, "verbose", False) is False
+
+    def test_get_int(self):
+        """Integers are parsed; missing or non-numeric values yield the default"""
+        assert get_int({"baud_rate": "9600"}, "baud_rate") == 9600
+        assert get_int({}, "baud_rate") is None
+        assert get_int({"baud_rate": "fast"}, "baud_rate", 115200) == 115200
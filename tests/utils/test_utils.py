@@ -27,6 +27,13 @@ class TestScancodeToAscii:
         # Test with right shift modifier (0x20)
         assert scancode_to_ascii(array("B", [0x20, 0, 0x1A, 0, 0, 0, 0, 0])) == "W"
 
+    def test_non_shift_modifiers(self):
+        """Test only the shift bits of the modifier byte select shifted characters"""
+        # Left ctrl (0x01) and left alt (0x04) do not shift
+        assert scancode_to_ascii(array("B", [0x05, 0, 0x04, 0, 0, 0, 0, 0])) == "a"
+        # Both shifts, plus ctrl, still shift
+        assert scancode_to_ascii(array("B", [0x23, 0, 0x04, 0, 0, 0, 0, 0])) == "A"
+
     def test_special_chars(self):
         """Test special characters and symbols"""
         assert scancode_to_ascii(array("B", [0, 0, 0x2D, 0, 0, 0, 0, 0])) == "-"
@@ -77,6 +84,12 @@ class TestAsciiToScancode:
         expected = array("B", [0, 0, 0, 0, 0, 0, 0, 0])
         assert ascii_to_scancode("€") == expected
 
+    def test_returns_independent_copies(self):
+        """Test cached conversions hand each caller a scancode it can safely modify"""
+        first = ascii_to_scancode("a")
+        first[0] = 0x1
+        assert ascii_to_scancode("a") == array("B", [0, 0, 0x04, 0, 0, 0, 0, 0])
+
 
 class TestBuildScancode:
     def test_basic_scancode(self):
@@ -147,6 +160,16 @@ class TestStringToScancodes:
         ]
         assert result == expected
 
+    def test_layout(self):
+        """Test string conversion honours the layout and falls back to en_GB"""
+        assert string_to_scancodes("@", layout="en_US") == [
+            array("B", [0x2, 0, 0x1F, 0, 0, 0, 0, 0]),
+        ]
+        assert string_to_scancodes("@", layout="invalid") == [
+            array("B", [0x2, 0, 0x34, 0, 0, 0, 0, 0]),
+        ]
+        assert string_to_scancodes("€") == [array("B", [0, 0, 0, 0, 0, 0, 0, 0])]
+
     def test_invalid_params(self):
         """Test invalid parameters raise ValueError"""
         with pytest.raises(ValueError):